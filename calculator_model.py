@@ -4,8 +4,270 @@ This class handles all mathematical operations and number parsing
 """
 
 import re
+import operator
+from functools import lru_cache
 from decimal import Decimal, getcontext, ROUND_HALF_UP
 
+# Optional JIT support for batch evaluation (CalculatorModel.evaluate_many)
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    np = None
+    _HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Translation table that deletes all whitespace in a single pass
+_WS_TABLE = str.maketrans('', '', ' \t\n\r\v\f')
+
+# Characters allowed in an expression once whitespace has been stripped
+_VALID_CHARS = frozenset('0123456789+-*/.()')
+
+# Precompiled token pattern (numbers and operators)
+_TOKEN_RE = re.compile(r'(\d+\.?\d*|\.\d+)|([+\-*/()])')
+
+# Binary operator precedence and implementations used by the RPN evaluator
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+_BINARY_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+# Unary minus binds tighter than any binary operator (as in Python)
+_NEG = 'neg'
+_NEG_PRECEDENCE = 3
+
+
+def _tokenize(expr):
+    """
+    Splits a sanitized expression into tokens.
+    
+    Args:
+        expr (str): Validated expression without whitespace
+        
+    Yields:
+        tuple: (kind, value) pairs, where kind is 'num' or 'op'
+        
+    Raises:
+        ValueError: If part of the expression is not a number or operator
+    """
+    pos = 0
+    for match in _TOKEN_RE.finditer(expr):
+        if match.start() != pos:
+            raise ValueError(f"unexpected character at position {pos}")
+        number, op = match.groups()
+        if number is not None:
+            yield 'num', float(number) if '.' in number else int(number)
+        else:
+            yield 'op', op
+        pos = match.end()
+    if pos != len(expr):
+        raise ValueError(f"unexpected character at position {pos}")
+
+
+def _shunt(tokens):
+    """
+    Converts infix tokens to Reverse Polish Notation using the shunting-yard algorithm.
+    
+    Args:
+        tokens: Iterable of (kind, value) pairs from _tokenize
+        
+    Returns:
+        tuple: RPN sequence of (kind, value) pairs
+        
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    output = []
+    stack = []
+    expect_operand = True
+    
+    for kind, value in tokens:
+        if kind == 'num':
+            if not expect_operand:
+                raise ValueError("missing operator")
+            output.append((kind, value))
+            expect_operand = False
+        elif value == '(':
+            if not expect_operand:
+                raise ValueError("missing operator before '('")
+            stack.append(value)
+        elif value == ')':
+            if expect_operand:
+                raise ValueError("missing operand before ')'")
+            while stack and stack[-1] != '(':
+                output.append(_pop_operator(stack))
+            if not stack:
+                raise ValueError("unbalanced parentheses")
+            stack.pop()
+        elif expect_operand:
+            # A sign in operand position is unary; unary plus is a no-op
+            if value == '-':
+                stack.append(_NEG)
+            elif value != '+':
+                raise ValueError(f"missing operand before '{value}'")
+        else:
+            precedence = _PRECEDENCE[value]
+            while stack and stack[-1] != '(' and _precedence_of(stack[-1]) >= precedence:
+                output.append(_pop_operator(stack))
+            stack.append(value)
+            expect_operand = True
+    
+    if expect_operand:
+        raise ValueError("missing operand at end of expression")
+    while stack:
+        if stack[-1] == '(':
+            raise ValueError("unbalanced parentheses")
+        output.append(_pop_operator(stack))
+    return tuple(output)
+
+
+def _precedence_of(op):
+    """Returns the precedence of an operator on the shunting-yard stack."""
+    return _NEG_PRECEDENCE if op == _NEG else _PRECEDENCE[op]
+
+
+def _pop_operator(stack):
+    """Pops an operator from the shunting-yard stack as an RPN entry."""
+    op = stack.pop()
+    return (_NEG, None) if op == _NEG else ('op', op)
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(expr):
+    """
+    Compiles a sanitized expression to RPN.
+    Results are cached so repeated expressions are only parsed once.
+    
+    Args:
+        expr (str): Validated expression without whitespace
+        
+    Returns:
+        tuple: RPN sequence of (kind, value) pairs
+    """
+    return _shunt(_tokenize(expr))
+
+
+def _eval_rpn(rpn):
+    """
+    Evaluates an RPN sequence produced by _compile_expr.
+    
+    Args:
+        rpn (tuple): RPN sequence of (kind, value) pairs
+        
+    Returns:
+        int or float: Result of the calculation
+        
+    Raises:
+        ZeroDivisionError: If a division has a zero divisor
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    ops = _BINARY_OPS
+    
+    for kind, value in rpn:
+        if kind == 'num':
+            push(value)
+        elif kind == _NEG:
+            stack[-1] = -stack[-1]
+        else:
+            b = pop()
+            a = pop()
+            if value == '/' and b == 0:
+                raise ZeroDivisionError("cannot divide by zero")
+            push(ops[value](a, b))
+    return stack[0]
+
+
+# Opcodes for the encoded RPN consumed by _run
+_OP_PUSH, _OP_ADD, _OP_SUB, _OP_MUL, _OP_DIV, _OP_NEG = range(6)
+_OPCODES = {'+': _OP_ADD, '-': _OP_SUB, '*': _OP_MUL, '/': _OP_DIV}
+
+
+@lru_cache(maxsize=256)
+def _encode_expr(expr):
+    """
+    Encodes a sanitized expression as parallel opcode/operand arrays.
+    Results are cached so repeated expressions skip tokenizing and encoding.
+    
+    Args:
+        expr (str): Validated expression without whitespace
+        
+    Returns:
+        tuple: (ops, vals, depth) where depth is the maximum stack size needed
+    """
+    ops = []
+    vals = []
+    depth = max_depth = 0
+    for kind, value in _compile_expr(expr):
+        if kind == 'num':
+            ops.append(_OP_PUSH)
+            vals.append(float(value))
+            depth += 1
+            max_depth = max(max_depth, depth)
+        elif kind == _NEG:
+            ops.append(_OP_NEG)
+            vals.append(0.0)
+        else:
+            ops.append(_OPCODES[value])
+            vals.append(0.0)
+            depth -= 1
+    if _HAS_NUMBA:
+        return np.array(ops, dtype=np.int8), np.array(vals, dtype=np.float64), max_depth
+    return tuple(ops), tuple(vals), max_depth
+
+
+@njit(cache=True)
+def _run(ops, vals, stack):
+    """
+    Evaluates encoded RPN using a preallocated stack buffer.
+    JIT-compiled when numba is available.
+    
+    Args:
+        ops: Opcodes (int8 array or sequence)
+        vals: Operands aligned with ops (float64 array or sequence)
+        stack: Writable buffer with room for the expression's stack depth
+        
+    Returns:
+        float: Result of the calculation
+        
+    Raises:
+        ZeroDivisionError: If a division has a zero divisor
+    """
+    top = 0
+    for i in range(len(ops)):
+        op = ops[i]
+        if op == _OP_PUSH:
+            stack[top] = vals[i]
+            top += 1
+        elif op == _OP_NEG:
+            stack[top - 1] = -stack[top - 1]
+        else:
+            top -= 1
+            b = stack[top]
+            a = stack[top - 1]
+            if op == _OP_ADD:
+                stack[top - 1] = a + b
+            elif op == _OP_SUB:
+                stack[top - 1] = a - b
+            elif op == _OP_MUL:
+                stack[top - 1] = a * b
+            else:
+                if b == 0.0:
+                    raise ZeroDivisionError("cannot divide by zero")
+                stack[top - 1] = a / b
+    return stack[0]
+
 
 class CalculatorModel:
     """
@@ -13,6 +275,8 @@ class CalculatorModel:
     Responsible for performing calculations and handling mathematical operations.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize the calculator model"""
         pass
@@ -34,64 +298,93 @@ class CalculatorModel:
         if not expression:
             return 0
         
-        # Remove any whitespace
-        expression = expression.replace(' ', '')
-        
-        # Validate the expression contains only valid characters
-        if not self._is_valid_expression(expression):
-            raise ValueError(f"Invalid expression: contains invalid characters")
+        expression = self._sanitize(expression)
         
-        # Check for division by zero
-        if self._has_division_by_zero(expression):
-            raise ZeroDivisionError("Division by zero: cannot divide by zero")
+        try:
+            # Parse to RPN (cached per expression)
+            rpn = _compile_expr(expression)
+        except ValueError as e:
+            raise ValueError(f"Invalid expression: {str(e)}")
         
         try:
-            # Evaluate the expression using Python's eval function
-            # Note: In a production environment, a safer parser would be recommended
-            result = eval(expression)
-            
-            # Check if result is a valid number
-            if isinstance(result, (int, float)):
-                return result
-            else:
-                raise ValueError(f"Invalid result: got {type(result).__name__} instead of number")
-        except (SyntaxError, NameError, TypeError) as e:
-            raise ValueError(f"Invalid expression: {type(e).__name__} - {str(e)}")
+            return _eval_rpn(rpn)
         except ZeroDivisionError as e:
             raise ZeroDivisionError(f"Division by zero: {str(e)}")
     
-    def _is_valid_expression(self, expression):
+    def evaluate_many(self, expressions):
         """
-        Validates that the expression contains only valid mathematical characters.
+        Evaluates many expression strings, e.g. when used as a library.
+        The evaluation loop is JIT-compiled when numba is installed, and
+        encoded expressions are cached so repeats skip parsing entirely.
         
         Args:
-            expression (str): Expression to validate
+            expressions (iterable): Mathematical expressions to evaluate
             
         Returns:
-            bool: True if valid, False otherwise
+            list: Float result of each expression, in order
+            
+        Raises:
+            ValueError: If any expression is invalid
+            ZeroDivisionError: If division by zero occurs
         """
-        # Regular expression to match valid mathematical expressions
-        # Allows digits, decimal points, operators (+, -, *, /), and parentheses
-        pattern = r'^[0-9+\-*/.() ]+$'
-        return bool(re.match(pattern, expression))
+        results = []
+        for expression in expressions:
+            if not expression:
+                results.append(0.0)
+                continue
+            
+            expression = self._sanitize(expression)
+            
+            try:
+                ops, vals, depth = _encode_expr(expression)
+            except ValueError as e:
+                raise ValueError(f"Invalid expression: {str(e)}")
+            
+            stack = np.empty(depth) if _HAS_NUMBA else [0.0] * depth
+            try:
+                results.append(float(_run(ops, vals, stack)))
+            except ZeroDivisionError as e:
+                raise ZeroDivisionError(f"Division by zero: {str(e)}")
+        return results
+    
+    @staticmethod
+    def _sanitize(expression):
+        """
+        Strips whitespace from an expression and validates its characters.
+        
+        Args:
+            expression (str): Mathematical expression to sanitize
+            
+        Returns:
+            str: Expression without whitespace
+            
+        Raises:
+            ValueError: If the expression contains invalid characters
+        """
+        # Remove any whitespace
+        expression = expression.translate(_WS_TABLE)
+        
+        # Validate the expression contains only valid characters
+        if not CalculatorModel._is_valid_expression(expression):
+            raise ValueError("Invalid expression: contains invalid characters")
+        return expression
     
-    def _has_division_by_zero(self, expression):
+    @staticmethod
+    def _is_valid_expression(expression):
         """
-        Checks if the expression contains division by zero.
+        Validates that the expression contains only valid mathematical characters.
         
         Args:
-            expression (str): Expression to check
+            expression (str): Expression to validate
             
         Returns:
-            bool: True if division by zero detected, False otherwise
+            bool: True if valid, False otherwise
         """
-        # Look for division by zero patterns
-        # This is a simplified check - in a real application, a more robust parser would be needed
-        # Check for /0, /0.0, /00, etc. followed by an operator or end of string
-        div_by_zero_pattern = r'/\s*0+\.?0*\s*(?=[+\-*/\)])|/\s*0+\.?0*\s*$'
-        return bool(re.search(div_by_zero_pattern, expression))
+        # Allows digits, decimal points, operators (+, -, *, /), and parentheses
+        return bool(expression) and _VALID_CHARS.issuperset(expression)
     
-    def add(self, a, b):
+    @staticmethod
+    def add(a, b):
         """
         Adds two numbers.
         
@@ -104,7 +397,8 @@ class CalculatorModel:
         """
         return a + b
     
-    def subtract(self, a, b):
+    @staticmethod
+    def subtract(a, b):
         """
         Subtracts second number from first number.
         
@@ -117,7 +411,8 @@ class CalculatorModel:
         """
         return a - b
     
-    def multiply(self, a, b):
+    @staticmethod
+    def multiply(a, b):
         """
         Multiplies two numbers.
         
@@ -130,7 +425,8 @@ class CalculatorModel:
         """
         return a * b
     
-    def divide(self, a, b):
+    @staticmethod
+    def divide(a, b):
         """
         Divides first number by second number using Decimal for precision.
         
@@ -153,7 +449,8 @@ class CalculatorModel:
         result = result.quantize(Decimal('0.0000000001'), rounding=ROUND_HALF_UP)
         return float(result)
     
-    def parse_number(self, number_str):
+    @staticmethod
+    def parse_number(number_str):
         """
         Parses a string representation of a number to float.
         
@@ -4,6 +4,7 @@ This class creates the user interface and binds it to the ViewModel
 """
 
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox
 from calculator_viewmodel import CalculatorViewModel
 
@@ -29,6 +30,10 @@ class CalculatorView:
         self.root.geometry("300x400")
         self.root.resizable(False, False)
         
+        # Pending display value, pushed to Tk once per idle cycle
+        self._pending = None
+        self._scheduled = False
+        
         # Bind the ViewModel's display updates to the View
         self.viewmodel.add_observer(self.update_display)
         
@@ -71,30 +76,36 @@ class CalculatorView:
         )
         self.error_tooltip.grid(row=6, column=0, columnspan=4, sticky="nsew", padx=5, pady=2)
         
+        # Prebuilt commands for digit and operator buttons. These call the
+        # ViewModel directly and bypass CalculatorView.input_digit/input_operator,
+        # which only the keyboard handler uses; other buttons use the view methods.
+        digit_cmds = {d: partial(self.viewmodel.input_digit, d) for d in '0123456789'}
+        operator_cmds = {op: partial(self.viewmodel.input_operator, op) for op in '+-*/'}
+        
         # Define button labels and positions
         button_config = [
             ('C', 1, 0, self.clear_all),
             ('CE', 1, 1, self.clear_entry),
             ('⌫', 1, 2, self.backspace),
-            ('/', 1, 3, lambda: self.input_operator('/')),
+            ('/', 1, 3, operator_cmds['/']),
             
-            ('7', 2, 0, lambda: self.input_digit('7')),
-            ('8', 2, 1, lambda: self.input_digit('8')),
-            ('9', 2, 2, lambda: self.input_digit('9')),
-            ('*', 2, 3, lambda: self.input_operator('*')),
+            ('7', 2, 0, digit_cmds['7']),
+            ('8', 2, 1, digit_cmds['8']),
+            ('9', 2, 2, digit_cmds['9']),
+            ('*', 2, 3, operator_cmds['*']),
             
-            ('4', 3, 0, lambda: self.input_digit('4')),
-            ('5', 3, 1, lambda: self.input_digit('5')),
-            ('6', 3, 2, lambda: self.input_digit('6')),
-            ('-', 3, 3, lambda: self.input_operator('-')),
+            ('4', 3, 0, digit_cmds['4']),
+            ('5', 3, 1, digit_cmds['5']),
+            ('6', 3, 2, digit_cmds['6']),
+            ('-', 3, 3, operator_cmds['-']),
             
-            ('1', 4, 0, lambda: self.input_digit('1')),
-            ('2', 4, 1, lambda: self.input_digit('2')),
-            ('3', 4, 2, lambda: self.input_digit('3')),
-            ('+', 4, 3, lambda: self.input_operator('+')),
+            ('1', 4, 0, digit_cmds['1']),
+            ('2', 4, 1, digit_cmds['2']),
+            ('3', 4, 2, digit_cmds['3']),
+            ('+', 4, 3, operator_cmds['+']),
             
             ('±', 5, 0, self.toggle_sign),
-            ('0', 5, 1, lambda: self.input_digit('0')),
+            ('0', 5, 1, digit_cmds['0']),
             ('.', 5, 2, self.input_decimal),
             ('=', 5, 3, self.calculate_result)
         ]
@@ -134,11 +145,21 @@ class CalculatorView:
     
     def update_display(self, value):
         """
-        Update the display with the new value.
+        Schedule a display update with the new value.
+        Bursts of updates are coalesced so only the latest value is shown.
         
         Args:
             value (str): New value to display
         """
+        self._pending = value
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self._flush_display)
+    
+    def _flush_display(self):
+        """Push the latest pending value to the display when Tk is idle."""
+        value = self._pending
+        self._scheduled = False
         self.display_var.set(value)
         # Clear error tooltip when display is updated normally
         if not value.startswith("Error"):
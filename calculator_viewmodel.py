@@ -3,9 +3,21 @@ Calculator ViewModel - Manages display state, current input, operation state, an
 This class acts as an intermediary between the Model and View components
 """
 
+import math
+
 from calculator_model import CalculatorModel
 
 
+# Binary operator dispatch table used by calculate_result.
+# All arithmetic goes through the (static) Model methods.
+_OPS = {
+    '+': CalculatorModel.add,
+    '-': CalculatorModel.subtract,
+    '*': CalculatorModel.multiply,
+    '/': CalculatorModel.divide,
+}
+
+
 class CalculatorViewModel:
     """
     ViewModel component of the MVVM pattern.
@@ -13,6 +25,13 @@ class CalculatorViewModel:
     Communicates with both the Model (for calculations) and the View (for UI updates).
     """
     
+    __slots__ = (
+        'model', 'display_value', 'current_input', 'operator',
+        'previous_value', 'should_reset_display', '_has_decimal',
+        '_display_numeric', '_numeric_dirty', '_observer',
+        '_extra_observers', 'last_error_message',
+    )
+    
     def __init__(self):
         """Initialize the calculator ViewModel"""
         self.model = CalculatorModel()
@@ -22,8 +41,17 @@ class CalculatorViewModel:
         self.previous_value = 0
         self.should_reset_display = False
         
-        # Observers for display updates
-        self.observers = []
+        # Whether the number currently being entered already has a decimal point
+        self._has_decimal = False
+        
+        # Numeric value of the display, reparsed only after the display text is edited
+        self._display_numeric = 0.0
+        self._numeric_dirty = False
+        
+        # Observers for display updates: the first one is called directly,
+        # any further ones are kept in a lazily created list
+        self._observer = None
+        self._extra_observers = None
         
         # Store last error message for tooltip display
         self.last_error_message = ""
@@ -35,12 +63,21 @@ class CalculatorViewModel:
         Args:
             observer: A callback function to be called when display updates
         """
-        self.observers.append(observer)
+        if self._observer is None:
+            self._observer = observer
+        elif self._extra_observers is None:
+            self._extra_observers = [observer]
+        else:
+            self._extra_observers.append(observer)
     
     def notify_observers(self):
         """Notify all observers that the display value has changed."""
-        for observer in self.observers:
-            observer(self.display_value)
+        value = self.display_value
+        if self._observer is not None:
+            self._observer(value)
+        if self._extra_observers:
+            for observer in self._extra_observers:
+                observer(value)
     
     def get_display_value(self):
         """
@@ -58,14 +95,16 @@ class CalculatorViewModel:
         Args:
             digit (str): The digit that was pressed
         """
+        dv = self.display_value
         if self.should_reset_display:
-            self.display_value = "0"
+            self.display_value = digit
             self.should_reset_display = False
-        
-        if self.display_value == "0":
+            self._has_decimal = False
+        elif dv == "0":
             self.display_value = digit
         else:
-            self.display_value += digit
+            self.display_value = dv + digit
+        self._numeric_dirty = True
         
         self.notify_observers()
     
@@ -74,33 +113,26 @@ class CalculatorViewModel:
         if self.should_reset_display:
             self.display_value = "0"
             self.should_reset_display = False
+            self._has_decimal = False
         
         # Add decimal point only if not already present in current number
-        # Extract the current number being entered (after the last operator)
-        current_number = self._get_current_number()
-        if '.' not in current_number:
+        if not self._has_decimal:
             self.display_value += '.'
+            self._has_decimal = True
+            self._numeric_dirty = True
             self.notify_observers()
     
-    def _get_current_number(self):
+    def _get_numeric(self):
         """
-        Extract the current number being entered from the display value.
+        Get the numeric value of the display, parsing it only if it changed.
         
         Returns:
-            str: The current number string (after the last operator)
+            float: Current display value as a number
         """
-        # Find the last operator position
-        last_op_pos = -1
-        operators = ['+', '-', '*', '/']
-        
-        for i, char in enumerate(self.display_value):
-            if char in operators:
-                last_op_pos = i
-        
-        # Return the part after the last operator, or the whole string if no operator
-        if last_op_pos >= 0:
-            return self.display_value[last_op_pos + 1:]
-        return self.display_value
+        if self._numeric_dirty:
+            self._display_numeric = float(self.display_value)
+            self._numeric_dirty = False
+        return self._display_numeric
     
     def input_operator(self, op):
         """
@@ -114,38 +146,41 @@ class CalculatorViewModel:
             self.calculate_result()
         
         # Store the current display value as the previous value
-        self.previous_value = float(self.display_value)
+        self.previous_value = self._get_numeric()
         
         # Set the operator
         self.operator = op
         
         # Prepare for next input
         self.should_reset_display = True
+        self._has_decimal = False
     
     def calculate_result(self):
         """Calculate the result of the current operation."""
-        if self.operator is None:
+        op = self.operator
+        if op is None:
             return
         
         try:
-            current_value = float(self.display_value)
+            try:
+                apply = _OPS[op]
+            except KeyError:
+                raise ValueError(f"Unknown operator: {op}")
+            result = apply(self.previous_value, self._get_numeric())
             
-            if self.operator == '+':
-                result = self.model.add(self.previous_value, current_value)
-            elif self.operator == '-':
-                result = self.model.subtract(self.previous_value, current_value)
-            elif self.operator == '*':
-                result = self.model.multiply(self.previous_value, current_value)
-            elif self.operator == '/':
-                result = self.model.divide(self.previous_value, current_value)
-            else:
-                raise ValueError(f"Unknown operator: {self.operator}")
+            if not math.isfinite(result):
+                raise OverflowError(f"result out of range: {result}")
             
             # Format result to remove unnecessary decimal places
-            if result == int(result):
-                self.display_value = str(int(result))
+            if isinstance(result, float) and result.is_integer():
+                display = str(int(result))
             else:
-                self.display_value = f"{result:g}"  # Removes trailing zeros
+                display = format(result, 'g')  # Removes trailing zeros
+            self.display_value = display
+            self._has_decimal = '.' in display
+            # Cache the value as displayed so chained operations use what the user sees
+            self._display_numeric = float(display)
+            self._numeric_dirty = False
             
             # Reset operator and prepare for next calculation
             self.operator = None
@@ -156,10 +191,14 @@ class CalculatorViewModel:
             
         except ZeroDivisionError as e:
             self.display_value = f"Error: {str(e)}"
+            self._has_decimal = False
+            self._numeric_dirty = True
             self.last_error_message = str(e)
             self.notify_observers()
         except Exception as e:
             self.display_value = f"Error: {type(e).__name__}: {str(e)}"
+            self._has_decimal = False
+            self._numeric_dirty = True
             self.last_error_message = f"{type(e).__name__}: {str(e)}"
             self.notify_observers()
     
@@ -170,6 +209,9 @@ class CalculatorViewModel:
         self.operator = None
         self.previous_value = 0
         self.should_reset_display = False
+        self._has_decimal = False
+        self._display_numeric = 0.0
+        self._numeric_dirty = False
         
         self.notify_observers()
     
@@ -177,42 +219,57 @@ class CalculatorViewModel:
         """Clear the current entry (display value)."""
         self.display_value = "0"
         self.current_input = ""
+        self._has_decimal = False
+        self._display_numeric = 0.0
+        self._numeric_dirty = False
         
         self.notify_observers()
     
     def backspace(self):
         """Remove the last character from the current input."""
         if len(self.display_value) > 1:
+            if self.display_value[-1] == '.':
+                self._has_decimal = False
             self.display_value = self.display_value[:-1]
         else:
             self.display_value = "0"
+            self._has_decimal = False
+        self._numeric_dirty = True
         
         self.notify_observers()
     
     def toggle_sign(self):
         """Toggle the sign of the current number."""
-        if self.display_value != "0":
-            if self.display_value.startswith("-"):
-                self.display_value = self.display_value[1:]
-            else:
-                self.display_value = "-" + self.display_value
-            
-            self.notify_observers()
+        dv = self.display_value
+        if dv == "0":
+            return
+        
+        self.display_value = dv[1:] if dv[:1] == '-' else '-' + dv
+        self._numeric_dirty = True
+        
+        self.notify_observers()
     
     def calculate_percentage(self):
         """Calculate the percentage of the current number."""
         try:
-            current_value = float(self.display_value)
+            current_value = self._get_numeric()
             result = current_value / 100
+            if not math.isfinite(result):
+                raise OverflowError(f"result out of range: {result}")
             
             # Format result to remove unnecessary decimal places
-            if result == int(result):
+            if isinstance(result, float) and result.is_integer():
                 self.display_value = str(int(result))
             else:
-                self.display_value = f"{result:g}"  # Removes trailing zeros
+                self.display_value = format(result, 'g')  # Removes trailing zeros
+            self._has_decimal = '.' in self.display_value
+            self._display_numeric = float(self.display_value)
+            self._numeric_dirty = False
             
             self.notify_observers()
         except Exception as e:
             self.display_value = f"Error: {type(e).__name__}: {str(e)}"
+            self._has_decimal = False
+            self._numeric_dirty = True
             self.last_error_message = f"{type(e).__name__}: {str(e)}"
             self.notify_observers()
\ No newline at end of file
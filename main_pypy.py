@@ -0,0 +1,11 @@
+"""
+PyPy entry point for the calculator application
+Runs the same application as main.py; use it with a PyPy interpreter
+(e.g. `pypy3 main_pypy.py`) for faster pure-Python evaluation
+"""
+
+from main import main
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,7 @@ def test_calculator_model():
     assert model.evaluate_expression("3 * 4") == 12
     assert model.evaluate_expression("15 / 3") == 5
     assert model.evaluate_expression("2.5 + 3.7") == 6.2
+    assert model.evaluate_expression("\t2 +\n3 ") == 5
     
     # Test complex expression
     assert model.evaluate_expression("(2 + 3) * 4") == 20
@@ -54,6 +55,13 @@ def test_calculator_model():
     except ZeroDivisionError:
         print("[PASS] Division by zero in expression handled correctly")
     
+    # Test division by a sub-expression that evaluates to zero
+    try:
+        model.evaluate_expression("1 / (1 - 1)")
+        assert False, "Should raise ZeroDivisionError"
+    except ZeroDivisionError:
+        print("[PASS] Division by computed zero handled correctly")
+    
     # Test negative numbers
     assert model.evaluate_expression("-5 + 3") == -2
     assert model.evaluate_expression("10 - -4") == 14
@@ -62,6 +70,23 @@ def test_calculator_model():
     assert model.evaluate_expression("2 + 3 + 4 + 5") == 14
     assert model.evaluate_expression("100 / 2 / 5") == 10
     
+    # Test invalid characters are rejected by both evaluation paths
+    for evaluate in (model.evaluate_expression, lambda e: model.evaluate_many([e])):
+        try:
+            evaluate("2 + x")
+            assert False, "Should raise ValueError for invalid characters"
+        except ValueError:
+            pass
+    
+    # Test batch evaluation (repeats hit the encoded-expression cache)
+    assert model.evaluate_many(["2 + 3", "(2 + 3) * -4", "2 + 3"]) == [5, -20, 5]
+    
+    try:
+        model.evaluate_many(["1", "1 / (1 - 1)"])
+        assert False, "Should raise ZeroDivisionError"
+    except ZeroDivisionError:
+        print("[PASS] Division by zero in batch evaluation handled correctly")
+    
     # Test parse_number
     assert model.parse_number("42") == 42
     assert model.parse_number("3.14") == 3.14
@@ -85,6 +110,13 @@ def test_calculator_viewmodel():
     # Test initial state
     assert vm.get_display_value() == "0"
     
+    # Test that every registered observer is notified
+    seen = []
+    vm.add_observer(seen.append)
+    vm.add_observer(seen.append)
+    vm.notify_observers()
+    assert seen == ["0", "0"]
+    
     # Test digit input
     vm.input_digit("5")
     assert vm.get_display_value() == "5"
@@ -97,6 +129,14 @@ def test_calculator_viewmodel():
     vm.input_digit("7")
     assert vm.get_display_value() == "53.7"
     
+    # Test repeated decimal is ignored, and allowed again after backspacing it
+    vm.input_decimal()
+    assert vm.get_display_value() == "53.7"
+    vm.backspace()
+    vm.backspace()
+    vm.input_decimal()
+    assert vm.get_display_value() == "53."
+    
     # Test clear
     vm.clear_all()
     assert vm.get_display_value() == "0"
@@ -181,6 +221,17 @@ def test_calculator_viewmodel():
     vm.toggle_sign()
     assert vm.get_display_value() == "5"
     
+    # Test toggling an emptied display does not fail: 5, ±, ⌫, ±, ±
+    vm.clear_all()
+    vm.input_digit("5")
+    vm.toggle_sign()
+    vm.backspace()
+    assert vm.get_display_value() == "-"
+    vm.toggle_sign()
+    assert vm.get_display_value() == ""
+    vm.toggle_sign()
+    assert vm.get_display_value() == "-"
+    
     # Test percentage calculation
     vm.clear_all()  # Reset display to "0"
     vm.input_digit("5")
@@ -207,6 +258,36 @@ def test_calculator_viewmodel():
     vm.calculate_result()  # 3+3=6
     assert vm.get_display_value() == "6"
     
+    # Test chaining uses the displayed value: 0.1 + 0.2 - 0.3 = 0
+    vm.clear_all()
+    vm.input_digit("0")
+    vm.input_decimal()
+    vm.input_digit("1")
+    vm.input_operator("+")
+    vm.input_digit("0")
+    vm.input_decimal()
+    vm.input_digit("2")
+    vm.input_operator("-")
+    vm.input_digit("0")
+    vm.input_decimal()
+    vm.input_digit("3")
+    vm.calculate_result()
+    assert vm.get_display_value() == "0"
+    
+    # Test division keeps Decimal rounding: 0.3 / 0.1 - 3 = 0
+    vm.clear_all()
+    vm.input_digit("0")
+    vm.input_decimal()
+    vm.input_digit("3")
+    vm.input_operator("/")
+    vm.input_digit("0")
+    vm.input_decimal()
+    vm.input_digit("1")
+    vm.input_operator("-")
+    vm.input_digit("3")
+    vm.calculate_result()
+    assert vm.get_display_value() == "0"
+    
     # Test negative number input: -5 + 3 = -2
     vm.clear_all()
     vm.input_digit("5")
@@ -234,6 +315,17 @@ def test_calculator_viewmodel():
     vm.calculate_result()
     assert vm.get_display_value().startswith("Error:")
     
+    # Test overflow is reported as an error instead of displaying "inf"
+    vm.clear_all()
+    vm.input_digit("1")
+    for _ in range(308):
+        vm.input_digit("0")
+    vm.input_operator("*")
+    vm.input_digit("9")
+    vm.calculate_result()
+    assert vm.get_display_value().startswith("Error: OverflowError")
+    assert vm.last_error_message.startswith("OverflowError")
+    
     print("[PASS] Calculator ViewModel tests passed!")
 
 
@@ -244,7 +336,13 @@ def test_calculator_view():
     import tkinter as tk
     from calculator_view import CalculatorView
     
-    root = tk.Tk()
+    # Tk needs a display (and may be unavailable, e.g. under some PyPy builds)
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"[SKIP] Calculator View tests skipped: {e}")
+        return
+    
     view = CalculatorView(root)
     
     # Test initial display
@@ -268,11 +366,88 @@ def test_calculator_view():
     view.backspace()
     assert view.viewmodel.get_display_value() == "9"
     
+    # Test that a burst of display updates is flushed once Tk is idle
+    view.clear_all()
+    view.input_digit("1")
+    view.input_digit("2")
+    view.input_digit("3")
+    root.update_idletasks()
+    assert view.display_var.get() == "123"
+    
+    # Test that a new update is scheduled again after the flush
+    view.input_digit("4")
+    root.update_idletasks()
+    assert view.display_var.get() == "1234"
+    
     root.destroy()
     
     print("[PASS] Calculator View tests passed!")
 
 
+def test_calculator_view_display_coalescing():
+    """Test that display updates are coalesced per idle cycle (no Tk needed)."""
+    print("\nTesting Calculator View display coalescing...")
+    
+    from calculator_view import CalculatorView
+    
+    class StubRoot:
+        """Records after_idle callbacks and runs them on update_idletasks."""
+        def __init__(self):
+            self.idle_calls = 0
+            self.pending = []
+        
+        def after_idle(self, callback):
+            self.idle_calls += 1
+            self.pending.append(callback)
+        
+        def update_idletasks(self):
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+    
+    class StubVar:
+        """Stands in for tk.StringVar."""
+        def __init__(self):
+            self.value = None
+        
+        def set(self, value):
+            self.value = value
+        
+        def get(self):
+            return self.value
+    
+    class StubLabel:
+        """Stands in for the error tooltip label."""
+        def config(self, **kwargs):
+            pass
+    
+    # Build the view without creating any Tk widgets
+    view = CalculatorView.__new__(CalculatorView)
+    view.root = StubRoot()
+    view.display_var = StubVar()
+    view.error_tooltip = StubLabel()
+    view._pending = None
+    view._scheduled = False
+    view.viewmodel = CalculatorViewModel()
+    view.viewmodel.add_observer(view.update_display)
+    
+    # A burst of updates schedules one flush showing the last value
+    view.input_digit("1")
+    view.input_digit("2")
+    view.input_digit("3")
+    assert view.root.idle_calls == 1
+    view.root.update_idletasks()
+    assert view.display_var.get() == "123"
+    
+    # A later update is scheduled again after the flush
+    view.input_digit("4")
+    assert view.root.idle_calls == 2
+    view.root.update_idletasks()
+    assert view.display_var.get() == "1234"
+    
+    print("[PASS] Calculator View display coalescing tests passed!")
+
+
 def main():
     """Run all tests."""
     print("Running Calculator Tests...\n")
@@ -280,6 +455,7 @@ def main():
     try:
         test_calculator_model()
         test_calculator_viewmodel()
+        test_calculator_view_display_coalescing()
         test_calculator_view()
         print("\n[PASS] All tests passed! The calculator components are working correctly.")
     except Exception as e: